@@ -10,6 +10,8 @@ import json
 import re
 import requests
 import warnings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from diaspy import errors
 
@@ -19,6 +21,11 @@ DEBUG = True
 
 class Connection():
 	"""Object representing connection with the pod.
+
+	All requests go through a single pooled `requests.Session()` so
+	consecutive calls (e.g. fetching a post and then its comments) reuse
+	an already established keep-alive connection instead of doing a new
+	TCP/TLS handshake each time.
 	"""
 	_token_regex = re.compile(r'name="csrf-token"\s+content="(.*?)"')
 	_userinfo_regex = re.compile(r'window.current_user_attributes = ({.*})')
@@ -38,6 +45,10 @@ class Connection():
 		"""
 		self.pod = pod
 		self._session = requests.Session()
+		adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50,
+							  max_retries=Retry(total=3, backoff_factor=0.1))
+		self._session.mount('https://', adapter)
+		self._session.mount('http://', adapter)
 		self._login_data = {'user[remember_me]': 1, 'utf8': '✓'}
 		self._userdata = {}
 		self._token = ''
@@ -92,7 +103,7 @@ class Connection():
 		self._fetch_token_from = location
 		return self
 
-	def post(self, string, data, headers={}, params={}, **kwargs):
+	def post(self, string, data=None, headers={}, params={}, **kwargs):
 		"""This method posts data to session.
 		Performs additional checks if needed.
 
@@ -101,7 +112,7 @@ class Connection():
 
 		:param string: URL to post without the pod's URL and slash eg. 'status_messages'.
 		:type string: str
-		:param data: Data to post.
+		:param data: Data to post (optional when passing `json=`).
 		:param headers: Headers (optional).
 		:type headers: dict
 		:param params: Parameters (optional).
@@ -158,6 +169,8 @@ class Connection():
 							allow_redirects=False)
 		if request.status_code != 302:
 			raise errors.LoginError('{0}: login failed'.format(request.status_code))
+		# signing in rotates the CSRF token, drop the stored one
+		self._token = ''
 
 	def login(self, remember_me=1):
 		"""This function is used to log in to a pod.
@@ -175,7 +188,7 @@ class Connection():
 		When logged out you can't do anything.
 		"""
 		self.get('users/sign_out')
-		self.token = ''
+		self._token = ''
 
 	def podswitch(self, pod, username, password, login=True):
 		"""Switches pod from current to another one.
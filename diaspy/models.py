@@ -9,6 +9,10 @@ MUST NOT import anything.
 import json
 import copy
 import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 
 BS4_SUPPORT=False
 try:
@@ -17,8 +21,39 @@ except ImportError:
 	print("[diaspy] BeautifulSoup not found, falling back on regex.")
 else: BS4_SUPPORT=True
 
+try:
+	from orjson import loads as _json_loads
+except ImportError:
+	_json_loads = json.loads
+
 from diaspy import errors
 
+_get_id = attrgetter('id')
+_HTMLTAG_RE = re.compile(r'<[^>]+>')
+_strip_html = _HTMLTAG_RE.sub
+
+
+def _csrf(connection):
+	"""Returns CSRF token stored by the connection, fetching it only if
+	there is none (e.g. after login or logout, which drop the stored token).
+	"""
+	return connection.get_token(fetch=False)
+
+
+def _fan_out(func, items, workers):
+	"""Calls `func` on every item from a thread pool.
+
+	Expected failures (D* errors, connection errors, undecodable JSON)
+	do not stop the batch: the exception is put in place of the result.
+
+	:returns: list of results (or exceptions) in order of `items`
+	"""
+	def call(item):
+		try: return func(item)
+		except (errors.DiaspyError, requests.RequestException, ValueError) as e: return e
+	with ThreadPoolExecutor(max_workers=workers) as executor:
+		return list(executor.map(call, items))
+
 class Aspect():
 	"""This class represents an aspect.
 
@@ -26,6 +61,8 @@ class Aspect():
 	parameters.
 	If both are missing, an exception will be raised.
 	"""
+	__slots__ = ('_connection', 'id', 'name', '_cached', '__weakref__')
+
 	def __init__(self, connection, id, name=None):
 		self._connection = connection
 		self.id, self.name = id, name
@@ -35,8 +72,8 @@ class Aspect():
 		"""Returns list of GUIDs of users who are listed in this aspect.
 		"""
 		if fetch:
-			request = self._connection.get('contacts.json?a_id={}'.format(self.id))
-			self._cached = request.json()
+			request = self._connection.get(f'contacts.json?a_id={self.id}')
+			self._cached = _json_loads(request.content)
 		return self._cached
 
 	def removeAspect(self):
@@ -49,16 +86,18 @@ class Aspect():
 		Removes whole aspect.
 		:returns: None
 		"""
-		request = self._connection.tokenFrom('contacts').delete('aspects/{}'.format(self.id))
+		request = self._connection.tokenFrom('contacts').delete(f'aspects/{self.id}')
 
 		if request.status_code != 302:
 			raise errors.AspectError('wrong status code: {0}'.format(request.status_code))
 
-	def addUser(self, user_id):
+	def addUser(self, user_id, token=None):
 		"""Add user to current aspect.
 
 		:param user_id: user to add to aspect
 		:type user_id: int
+		:param token: CSRF token to use instead of fetching a new one
+		:type token: str
 		:returns: JSON from request
 
 		--> POST /aspect_memberships HTTP/1.1
@@ -71,9 +110,10 @@ class Aspect():
 		"""
 		data = {'aspect_id': self.id,
 				'person_id': user_id}
-		headers = {'content-type': 'application/json',
-					'accept': 'application/json'}
-		request = self._connection.tokenFrom('contacts').post('aspect_memberships', data=json.dumps(data), headers=headers)
+		headers = {'accept': 'application/json'}
+		if token: headers['X-CSRF-Token'] = token
+		else: self._connection.tokenFrom('contacts')
+		request = self._connection.post('aspect_memberships', json=data, headers=headers)
 
 		if request.status_code == 400:
 			raise errors.AspectError('duplicate record, user already exists in aspect: {0}'.format(request.status_code))
@@ -100,24 +140,55 @@ class Aspect():
 		# Or update it locally with the response
 		return response
 
-	def removeUser(self, user):
+	def addUsers(self, user_ids, workers=8):
+		"""Add several users to current aspect.
+
+		Requests are sent concurrently and share a single CSRF token.
+		Failures do not stop the batch; the exception is put in place
+		of the response for the user that failed.
+
+		:param user_ids: users to add to aspect
+		:type user_ids: list
+		:param workers: maximum number of concurrent requests
+		:type workers: int
+		:returns: list of JSON responses (or exceptions) in order of `user_ids`
+		"""
+		token = self._connection.tokenFrom('contacts').get_token()
+		return _fan_out(partial(self.addUser, token=token), user_ids, workers)
+
+	def removeUsers(self, users, workers=8):
+		"""Remove several users from current aspect.
+
+		Behaves like `addUsers()`: requests are sent concurrently, share
+		a single CSRF token and failures are returned instead of raised.
+
+		:param users: users to remove from aspect
+		:type users: list of diaspy.people.User objects
+		:param workers: maximum number of concurrent requests
+		:type workers: int
+		:returns: list of JSON responses (or exceptions) in order of `users`
+		"""
+		token = self._connection.get_token()
+		return _fan_out(partial(self.removeUser, token=token), users, workers)
+
+	def removeUser(self, user, token=None):
 		"""Remove user from current aspect.
 
 		:param user: user to remove from aspect
 		:type user: diaspy.people.User object
+		:param token: CSRF token to use instead of fetching a new one
+		:type token: str
 		"""
-		membership_id = None
-		to_remove = None
-		for each in user.aspectMemberships():
-			if each.get('aspect', {}).get('id') == self.id:
-				membership_id = each.get('id')
-				to_remove = each
-				break # no need to continue
+		to_remove = next((each for each in user.aspectMemberships()
+						if each.get('aspect', {}).get('id') == self.id), None)
+		membership_id = to_remove.get('id') if to_remove else None
 
 		if membership_id is None:
 			raise errors.UserIsNotMemberOfAspect(user, self)
 
-		request = self._connection.delete('aspect_memberships/{0}'.format(membership_id))
+		headers = {}
+		if token: headers['X-CSRF-Token'] = token
+		request = self._connection.delete(f'aspect_memberships/{membership_id}', headers=headers)
 
 		if request.status_code == 404:
 			raise errors.AspectError('cannot remove user from aspect, probably tried too fast after adding: {0}'.format(request.status_code))
@@ -136,8 +207,12 @@ class Notification():
 	"""This class represents single notification.
 	"""
 	_who_regexp = re.compile(r'/people/([0-9a-f]+)["\']{1} class=["\']{1}hovercardable')
-	_aboutid_regexp = re.compile(r'/posts/[0-9a-f]+')
-	_htmltag_regexp = re.compile('</?[a-z]+( *[a-z_-]+=["\'].*?["\'])* */?>')
+	_who_find = _who_regexp.findall
+	_aboutid_regexp = re.compile(r'/posts/([0-9a-f-]+)')
+	# D* post guids are 16 hex chars (older pods) or hyphenated UUIDs, so
+	# anything shorter that is made only of decimal digits is a numeric post id
+	_guid_min_length = 16
+	__slots__ = ('_connection', 'type', '_data', 'id', 'unread', '_stripped', '_who', '_about', '__weakref__')
 
 	def __init__(self, connection, data):
 		self._connection = connection
@@ -145,6 +220,9 @@ class Notification():
 		self._data = data[self.type]
 		self.id = self._data['id']
 		self.unread = self._data['unread']
+		self._stripped = None
+		self._who = None
+		self._about = None
 
 	def __getitem__(self, key):
 		"""Returns a key from notification data.
@@ -154,17 +232,19 @@ class Notification():
 	def __str__(self):
 		"""Returns notification note.
 		"""
+		if self._stripped is not None: return self._stripped
 		if BS4_SUPPORT:
 			soup = BeautifulSoup(self._data['note_html'], 'lxml')
 			media_body = soup.find('div', {"class": "media-body"})
 			div = media_body.find('div')
 			if div: div.decompose()
-			return media_body.getText().strip()
+			self._stripped = media_body.getText().strip()
 		else:
-			string = re.sub(self._htmltag_regexp, '', self._data['note_html'])
-			string = string.strip().split('\n')[0]
-			while '  ' in string: string = string.replace('  ', ' ')
-			return string
+			string = _strip_html('', self._data['note_html'])
+			string = string.strip().split('\n', 1)[0]
+			string = ' '.join(string.split())
+			self._stripped = string
+		return self._stripped
 
 	def __repr__(self):
 		"""Returns notification note with more details.
@@ -174,25 +254,36 @@ class Notification():
 	def about(self):
 		"""Returns id of post about which the notification is informing OR:
 		If the id is None it means that it's about user so .who() is called.
+
+		Numeric post ids are returned as `int`. Post guids (16 hex chars or
+		hyphenated UUIDs) and user guids from .who() are returned as `str`.
 		"""
+		if self._about is not None: return self._about
 		if BS4_SUPPORT:
 			soup = BeautifulSoup(self._data['note_html'], 'lxml')
 			id = soup.find('a', {"data-ref": True})
-			if id: return id['data-ref']
-		about = self._aboutid_regexp.search(self._data['note_html'])
-		if about is None: about = self.who()[0]
-		else: about = int(about.group(0)[7:])
-		return about
+			if id:
+				self._about = id['data-ref']
+				return self._about
+		match = self._aboutid_regexp.search(self._data['note_html'])
+		if match is None:
+			self._about = self.who()[0]
+			return self._about
+		id = match.group(1)
+		self._about = int(id) if len(id) < self._guid_min_length and id.isdigit() else id
+		return self._about
 
 	def who(self):
 		"""Returns list of guids of the users who caused you to get the notification.
 		"""
-		if BS4_SUPPORT: # Parse the HTML with BS4
-			soup = BeautifulSoup(self._data['note_html'], 'lxml')
-			hovercardable_soup = soup.findAll('a', {"class": "hovercardable"})
-			return list(set([soup['href'][8:] for soup in hovercardable_soup]))
-		else:
-			return list(set([who for who in self._who_regexp.findall(self._data['note_html'])]))
+		if self._who is None:
+			if BS4_SUPPORT: # Parse the HTML with BS4
+				soup = BeautifulSoup(self._data['note_html'], 'lxml')
+				hovercardable_soup = soup.findAll('a', {"class": "hovercardable"})
+				self._who = tuple(set([soup['href'][8:] for soup in hovercardable_soup]))
+			else:
+				self._who = tuple(set(self._who_find(self._data['note_html'])))
+		return list(self._who)
 
 	def when(self):
 		"""Returns UTC time as found in note_html.
@@ -207,9 +298,9 @@ class Notification():
 		:param unread: which state set for notification
 		:type unread: bool
 		"""
-		headers = {'x-csrf-token': repr(self._connection)}
-		params = {'set_unread': json.dumps(unread)}
-		self._connection.put('notifications/{0}'.format(self['id']), params=params, headers=headers)
+		headers = {'X-CSRF-Token': _csrf(self._connection)}
+		params = {'set_unread': 'true' if unread else 'false'}
+		self._connection.put(f'notifications/{self.id}', params=params, headers=headers)
 		self._data['unread'] = unread
 
 
@@ -227,6 +318,8 @@ class Conversation():
 		_message_author_guid_regexp = re.compile(r'<a href=["\']{1}/people/([a-f0-9]+)["\']{1} class=["\']{1}img')
 		_message_author_name_regexp = re.compile(r'<img alt=["\']{1}(.*?)["\']{1}.*')
 		_message_author_avatar_regexp = re.compile(r'src=["\']{1}(.*?)["\']{1}')
+	__slots__ = ('_connection', 'id', '_data', '_messages', 'subject', '__weakref__')
+
 	def __init__(self, connection, id, fetch=True):
 		"""
 		:param conv_id: id of the post and not the guid!
@@ -238,6 +331,7 @@ class Conversation():
 		self.id = id
 		self._data = {}
 		self._messages = []
+		self.subject = None
 		if fetch: self._fetch()
 
 	def __len__(self): return len(self._messages)
@@ -247,9 +341,10 @@ class Conversation():
 	def _fetch(self):
 		"""Fetches JSON data representing conversation.
 		"""
-		request = self._connection.get('conversations/{}.json'.format(self.id))
+		request = self._connection.get(f'conversations/{self.id}.json')
 		if request.status_code == 200:
 			self._data = request.json()['conversation']
+			self.subject = self._data.get('subject')
 		else:
 			raise errors.ConversationError('cannot download conversation data: {0}'.format(request.status_code))
 
@@ -257,7 +352,7 @@ class Conversation():
 		"""Fetches HTML data we will use to parse message data.
 		This is a workaround until Diaspora* has it's API plans implemented.
 		"""
-		request = self._connection.get('conversations/{}'.format(self.id))
+		request = self._connection.get(f'conversations/{self.id}')
 		if request.status_code == 200:
 			# Clear potential old messages
 			self._messages = []
@@ -357,11 +452,11 @@ class Conversation():
 		"""
 		data = {'message[text]': text,
 				'utf8': '&#x2713;',
-				'authenticity_token': repr(self._connection)}
+				'authenticity_token': _csrf(self._connection)}
 
-		request = self._connection.post('conversations/{}/messages'.format(self.id),
+		request = self._connection.post(f'conversations/{self.id}/messages',
 										data=data,
-										headers={'accept': 'application/json'})
+										headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 		if request.status_code != 200:
 			raise errors.ConversationError('{0}: Answer could not be posted.'
 										   .format(request.status_code))
@@ -371,12 +466,11 @@ class Conversation():
 		"""Delete this conversation.
 		Has to be implemented.
 		"""
-		data = {'authenticity_token': repr(self._connection)}
+		data = {'authenticity_token': _csrf(self._connection)}
 
-		request = self._connection.delete('conversations/{0}/visibility/'
-								.format(self.id),
+		request = self._connection.delete(f'conversations/{self.id}/visibility/',
 								data=data,
-								headers={'accept': 'application/json'})
+								headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 
 		if request.status_code != 404:
 			raise errors.ConversationError('{0}: Conversation could not be deleted.'
@@ -385,7 +479,7 @@ class Conversation():
 	def get_subject(self):
 		"""Returns the subject of this conversation
 		"""
-		return self._data['subject']
+		return self.subject
 
 
 class Comment():
@@ -396,33 +490,43 @@ class Comment():
 	by `Comments()` objects wich automatically will be created by `Post()` 
 	objects.
 	"""
+	__slots__ = ('_data', 'id', 'guid', 'text', 'created_at', 'author_name', 'author_guid', '__weakref__')
+
 	def __init__(self, data):
 		self._data = data
 		self.id = data['id']
 		self.guid = data['guid']
+		self.text = data['text']
+		self.created_at = data['created_at']
+		self.author_name = data['author'].get('name')
+		self.author_guid = data['author'].get('guid')
 
 	def __str__(self):
 		"""Returns comment's text.
 		"""
-		return self._data['text']
+		return self.text
 
 	def __repr__(self):
 		"""Returns comments text and author.
 		Format: AUTHOR (AUTHOR'S GUID): COMMENT
 		"""
-		return '{0} ({1}): {2}'.format(self.author(), self.author('guid'), str(self))
+		return '{0} ({1}): {2}'.format(self.author_name, self.author_guid, self.text)
 
 	def when(self):
 		"""Returns time when the comment had been created.
 		"""
-		return self._data['created_at']
+		return self.created_at
 
 	def author(self, key='name'):
 		"""Returns author of the comment.
 		"""
+		if key == 'name': return self.author_name
+		if key == 'guid': return self.author_guid
 		return self._data['author'][key]
 
 class Comments():
+	__slots__ = ('_comments', '__weakref__')
+
 	def __init__(self, comments=[]):
 		self._comments = comments
 
@@ -440,7 +544,7 @@ class Comments():
 		return False
 
 	def ids(self):
-		return [c.id for c in self._comments]
+		return list(map(_get_id, self._comments))
 
 	def add(self, comment):
 		""" Expects Comment() object
@@ -460,7 +564,7 @@ class Comments():
 	def set_json(self, json_comments):
 		"""Sets comments for this post from post data."""
 		if json_comments:
-			self._comments = [Comment(c) for c in json_comments]
+			self._comments = list(map(Comment, json_comments))
 
 class Post():
 	"""This class represents a post.
@@ -468,6 +572,8 @@ class Post():
 	.. note::
 		Remember that you need to have access to the post.
 	"""
+	__slots__ = ('_connection', 'id', 'guid', '_data', 'comments', '__weakref__')
+
 	def __init__(self, connection, id=0, guid='', fetch=True, comments=True, post_data=None):
 		"""
 		:param id: id of the post (GUID is recommended)
@@ -492,13 +598,30 @@ class Post():
 		if post_data:
 			self._data = post_data
 
-		if fetch: self._fetchdata()
-		if comments:
-			if not self._data: self._fetchdata()
-			self._fetchcomments()
-		else:
-			if not self._data: self._fetchdata()
-			self.comments.set_json( self.data()['interactions']['comments'] )
+		if fetch or not self._data: self._fetchdata()
+		if comments: self._fetchcomments()
+		else: self.comments.set_json( self._data['interactions']['comments'] )
+
+	@classmethod
+	def prefetch_many(cls, connection, ids, comments=True, workers=16):
+		"""Fetches several posts (and optionally their comments) concurrently.
+
+		Like `Aspect.addUsers()`, a post that cannot be fetched does not stop
+		the batch: the error (DiaspyError, connection error or undecodable
+		JSON) is put in place of its Post().
+
+		:param connection: connection object used to authenticate
+		:type connection: connection.Connection
+		:param ids: ids of the posts to fetch
+		:type ids: list
+		:param comments: defines whether to fetch posts' comments or not
+		:type comments: bool
+		:param workers: maximum number of concurrent requests
+		:type workers: int
+		:returns: list of Post() objects (or exceptions) in order of `ids`
+		"""
+		def fetch(id): return cls(connection, id=id, fetch=True, comments=comments)
+		return _fan_out(fetch, ids, workers)
 
 	def __repr__(self):
 		"""Returns string containing more information then str().
@@ -517,25 +640,26 @@ class Post():
 		"""
 		if self.id: id = self.id
 		if self.guid: id = self.guid
-		request = self._connection.get('posts/{0}.json'.format(id))
+		request = self._connection.get(f'posts/{id}.json')
 		if request.status_code != 200:
 			raise errors.PostError('{0}: could not fetch data for post: {1}'.format(request.status_code, id))
 		elif request:
-			self._data = request.json()
-		return self.data()['guid']
+			self._data = _json_loads(request.content)
+		return self._data['guid']
 
 	def _fetchcomments(self):
 		"""Retreives comments for this post.
 		Retrieving comments via GUID will result in 404 error.
 		DIASPORA* does not supply comments through /posts/:guid/ endpoint.
 		"""
-		id = self.data()['id']
-		if self.data()['interactions']['comments_count']:
-			request = self._connection.get('posts/{0}/comments.json'.format(id))
+		data = self._data
+		id = data['id']
+		if data['interactions']['comments_count']:
+			request = self._connection.get(f'posts/{id}/comments.json')
 			if request.status_code != 200:
 				raise errors.PostError('{0}: could not fetch comments for post: {1}'.format(request.status_code, id))
 			else:
-				self.comments.set([Comment(c) for c in request.json()])
+				self.comments.set(list(map(Comment, _json_loads(request.content))))
 
 	def fetch(self, comments = False):
 		"""Fetches post data.
@@ -556,11 +680,11 @@ class Post():
 
 		:returns: dict -- json formatted like object.
 		"""
-		data = {'authenticity_token': repr(self._connection)}
+		data = {'authenticity_token': _csrf(self._connection)}
 
-		request = self._connection.post('posts/{0}/likes'.format(self.id),    
+		request = self._connection.post(f'posts/{self.id}/likes',
 										data=data,
-										headers={'accept': 'application/json'})
+										headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 
 		if request.status_code != 201:
 			raise errors.PostError('{0}: Post could not be liked.'
@@ -575,11 +699,11 @@ class Post():
 		"""This function reshares a post
 		"""
 		data = {'root_guid': self._data['guid'],
-				'authenticity_token': repr(self._connection)}
+				'authenticity_token': _csrf(self._connection)}
 
 		request = self._connection.post('reshares',
 										data=data,
-										headers={'accept': 'application/json'})
+										headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 		if request.status_code != 201:
 			raise Exception('{0}: Post could not be reshared'.format(request.status_code))
 		return request.json()
@@ -591,10 +715,10 @@ class Post():
 		:type text: str
 		"""
 		data = {'text': text,
-				'authenticity_token': repr(self._connection)}
-		request = self._connection.post('posts/{0}/comments'.format(self.id),
+				'authenticity_token': _csrf(self._connection)}
+		request = self._connection.post(f'posts/{self.id}/comments',
 										data=data,
-										headers={'accept': 'application/json'})
+										headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 
 		if request.status_code != 201:
 			raise Exception('{0}: Comment could not be posted.'
@@ -611,10 +735,10 @@ class Post():
 		data = {'poll_answer_id': poll_answer_id,
 				'poll_id': poll_id,
 				'post_id': self.id,
-				'authenticity_token': repr(self._connection)}
-		request = self._connection.post('posts/{0}/poll_participations'.format(self.id),
+				'authenticity_token': _csrf(self._connection)}
+		request = self._connection.post(f'posts/{self.id}/poll_participations',
 										data=data,
-										headers={'accept': 'application/json'})
+										headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 		if request.status_code != 201:
 			raise Exception('{0}: Vote on poll failed.'
 							.format(request.status_code))
@@ -626,8 +750,8 @@ class Post():
 			  post_id=123
 		<-    HTTP/1.1 200 OK
 		"""
-		headers = {'x-csrf-token': repr(self._connection)}
-		params = {'post_id': json.dumps(self.id)}
+		headers = {'X-CSRF-Token': _csrf(self._connection)}
+		params = {'post_id': str(self.id)}
 		request = self._connection.put('share_visibilities/42', params=params, headers=headers)
 		if request.status_code != 200:
 			raise Exception('{0}: Failed to hide post.'
@@ -639,9 +763,9 @@ class Post():
 			{"block":{"person_id":123}}
 		<-    HTTP/1.1 204 No Content 
 		"""
-		headers = {'content-type':'application/json', 'x-csrf-token': repr(self._connection)}
-		data = json.dumps({ 'block': { 'person_id' : self._data['author']['id'] } })
-		request = self._connection.post('blocks', data=data, headers=headers)
+		headers = {'X-CSRF-Token': _csrf(self._connection)}
+		data = { 'block': { 'person_id' : self._data['author']['id'] } }
+		request = self._connection.post('blocks', json=data, headers=headers)
 		if request.status_code != 204:
 			raise Exception('{0}: Failed to block person'
 							.format(request.status_code))
@@ -651,10 +775,9 @@ class Post():
 		->    POST /posts/123/participation HTTP/1.1
 		<-    HTTP/1.1 201 Created
 		"""
-		headers = {'x-csrf-token': repr(self._connection)}
+		headers = {'X-CSRF-Token': _csrf(self._connection)}
 		data = {}
-		request = self._connection.post('posts/{}/participation'
-							.format( self.id ), data=data, headers=headers)
+		request = self._connection.post(f'posts/{self.id}/participation', data=data, headers=headers)
 		if request.status_code != 201:
 			raise Exception('{0}: Failed to subscribe to post'
 							.format(request.status_code))
@@ -665,10 +788,9 @@ class Post():
 			  _method=delete
 		<-    HTTP/1.1 200 OK
 		"""
-		headers = {'x-csrf-token': repr(self._connection)}
+		headers = {'X-CSRF-Token': _csrf(self._connection)}
 		data = { "_method": "delete" }
-		request = self._connection.post('posts/{}/participation'
-							.format( self.id ), headers=headers, data=data)
+		request = self._connection.post(f'posts/{self.id}/participation', headers=headers, data=data)
 		if request.status_code != 200:
 			raise Exception('{0}: Failed to unsubscribe to post'
 							.format(request.status_code))
@@ -682,10 +804,10 @@ class Post():
 	def delete(self):
 		""" This function deletes this post
 		"""
-		data = {'authenticity_token': repr(self._connection)}
-		request = self._connection.delete('posts/{0}'.format(self.id),
+		data = {'authenticity_token': _csrf(self._connection)}
+		request = self._connection.delete(f'posts/{self.id}',
 										  data=data,
-										  headers={'accept': 'application/json'})
+										  headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 		if request.status_code != 204:
 			raise errors.PostError('{0}: Post could not be deleted'.format(request.status_code))
 
@@ -695,11 +817,10 @@ class Post():
 		:param comment_id: id of the comment to remove.
 		:type comment_id: str
 		"""
-		data = {'authenticity_token': repr(self._connection)}
-		request = self._connection.delete('posts/{0}/comments/{1}'
-										  .format(self.id, comment_id),
+		data = {'authenticity_token': _csrf(self._connection)}
+		request = self._connection.delete(f'posts/{self.id}/comments/{comment_id}',
 										  data=data,
-										  headers={'accept': 'application/json'})
+										  headers={'accept': 'application/json', 'X-CSRF-Token': _csrf(self._connection)})
 
 		if request.status_code != 204:
 			raise errors.PostError('{0}: Comment could not be deleted'
@@ -708,9 +829,9 @@ class Post():
 	def delete_like(self):
 		"""This function removes a like from a post
 		"""
-		data = {'authenticity_token': repr(self._connection)}
-		url = 'posts/{0}/likes/{1}'.format(self.id, self._data['interactions']['likes'][0]['id'])
-		request = self._connection.delete(url, data=data)
+		data = {'authenticity_token': _csrf(self._connection)}
+		url = f"posts/{self.id}/likes/{self._data['interactions']['likes'][0]['id']}"
+		request = self._connection.delete(url, data=data, headers={'X-CSRF-Token': _csrf(self._connection)})
 		if request.status_code != 204:
 			raise errors.PostError('{0}: Like could not be removed.'
 								   .format(request.status_code))
@@ -21,8 +21,10 @@ setup(
         'Topic :: Utilities',
     ],
     packages=find_packages(),
-    install_requires=['requests', 'python-dateutil'],
+    python_requires='>=3.6',
+    install_requires=['requests>=2.16', 'python-dateutil'],
     extras_require={
-        'beautifulsoup4': ["beautifulsoup4>=3.2.1"]
+        'beautifulsoup4': ["beautifulsoup4>=3.2.1"],
+        'orjson': ["orjson"]
     }
 )
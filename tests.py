@@ -227,6 +227,34 @@ class NotificationsTests(unittest.TestCase):
 		else:
 			warnings.warn('test not sufficient: no unread notifications were found')
 
+	def _notification(self, note_html):
+		data = {'liked': {'id': 1, 'unread': True, 'created_at': '', 'note_html': note_html}, 'type': 'liked'}
+		return diaspy.models.Notification(test_connection, data)
+
+	def testAboutPostIdOrGuid(self):
+		note = '<a href="/people/0123456789abcdef" class="hovercardable">Foo</a> liked your <a href="/posts/{0}">post</a>.'
+		self.assertEqual(1234, self._notification(note.format('1234')).about())
+		self.assertEqual('0123456789abcdef', self._notification(note.format('0123456789abcdef')).about())
+		self.assertEqual('1234567890123456', self._notification(note.format('1234567890123456')).about())
+		uuid = '12345678-1b2c-4d5e-8f90-0123456789ab'
+		self.assertEqual(uuid, self._notification(note.format(uuid)).about())
+
+	def testStrippingTagsMatchesOldPattern(self):
+		old_htmltag_regexp = re.compile('</?[a-z]+( *[a-z_-]+=["\'].*?["\'])* */?>')
+		def old_str(note_html):
+			string = old_htmltag_regexp.sub('', note_html).strip().split('\n')[0]
+			while '  ' in string: string = string.replace('  ', ' ')
+			return string
+		notes = [n['note_html'] for n in diaspy.notifications.Notifications(test_connection)]
+		notes.append('<div class="media-body"><a class="hovercardable" data-hovercard="/people/0123456789abcdef" href="/people/0123456789abcdef">Foo  Bar</a>  liked your <a href="/posts/1234">post</a>.\n<div class="pull-right"><time datetime="2017-01-01T00:00:00Z"></time></div></div>')
+		bs4_support = diaspy.models.BS4_SUPPORT
+		diaspy.models.BS4_SUPPORT = False # test the regex path
+		try:
+			for note in notes:
+				self.assertEqual(old_str(note), str(self._notification(note)))
+		finally:
+			diaspy.models.BS4_SUPPORT = bs4_support
+
 
 class SettingsTests(unittest.TestCase):
 	profile = diaspy.settings.Profile(test_connection)